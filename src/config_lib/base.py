@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 if sys.version_info >= (3, 11):
     from typing import ClassVar, Self
@@ -13,13 +16,15 @@ else:
     from typing_extensions import Self
 
 import msgspec
-from yaml import YAMLError
 
 from config_lib.sources.cli import get_cli_values
 from config_lib.sources.env import get_env_values
-from config_lib.sources.yaml import get_yaml_values
+from config_lib.sources.yaml import get_yaml_values, get_yaml_values_typed
 from config_lib.utils.merge import update_recursive
 
+if TYPE_CHECKING:
+    from config_lib.utils.types import ConfigMapping
+
 SOURCES_MAP = {
     "cli": get_cli_values,
     "yaml": get_yaml_values,
@@ -28,6 +33,21 @@ SOURCES_MAP = {
 
 logger = logging.getLogger(__name__)
 
+# Latest load result per class: ((argv, prefixed env), config path, file signature, config).
+# Only one entry is kept per class, so the cache cannot grow with changing inputs.
+_LOAD_CACHE: dict[type, tuple[tuple[Any, ...], str | None, tuple[int, int] | None, Any]] = {}
+
+
+def _file_signature(file_path: str | None) -> tuple[int, int] | None:
+    """Return the (mtime in ns, size) of a file, or None if there is no readable file."""
+    if not file_path:
+        return None
+    try:
+        stat = Path(file_path).stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
 
 class ConfigSourceError(Exception):
     """Base class for configuration source errors."""
@@ -47,18 +67,63 @@ class BaseConfig(msgspec.Struct):
 
     Attributes:
         env_prefix: The prefix for environment variables (default: "CFG_").
+        cache_load: Whether `load` reuses the previous result while the command line, the prefixed
+            environment variables and the YAML file are unchanged (default: False). The cached
+            instance is shared between calls, so it should not be mutated.
 
     """
 
     env_prefix: ClassVar[str] = "CFG_"
+    cache_load: ClassVar[bool] = False
+
+    @classmethod
+    def _has_overrides(cls, env_values: ConfigMapping, cli_values: ConfigMapping) -> bool:
+        """Check whether env or CLI values carry anything besides the config file path."""
+        keys = env_values.keys() | cli_values.keys()
+        return bool(keys - {"config"}) or "config" in cls.__struct_fields__
+
+    @classmethod
+    def clear_load_cache(cls) -> None:
+        """Drop the cached `load` result of this class."""
+        _ = _LOAD_CACHE.pop(cls, None)
 
     @classmethod
     def load(cls) -> Self:
         """Load configuration from available sources.
 
+        When `cache_load` is enabled, the latest result is returned as long as `sys.argv`,
+        the environment variables with `env_prefix` and the YAML file are unchanged.
+
         Returns:
             An instance of the configuration class with values loaded from YAML, environment, and CLI.
 
+        """
+        if not cls.cache_load:
+            config, _, _ = cls._load_sources()
+            return config
+
+        key = (
+            tuple(sys.argv),
+            frozenset((name, value) for name, value in os.environ.items() if name.startswith(cls.env_prefix)),
+        )
+        cached = _LOAD_CACHE.get(cls)
+        if cached is not None:
+            cached_key, config_path, signature, config = cached
+            if cached_key == key and _file_signature(config_path) == signature:
+                return config
+
+        config, config_path, signature = cls._load_sources()
+        _LOAD_CACHE[cls] = (key, config_path, signature, config)
+        return config
+
+    @classmethod
+    def _load_sources(cls) -> tuple[Self, str | None, tuple[int, int] | None]:
+        """Load configuration from all sources.
+
+        Returns:
+            The loaded configuration, the path of the YAML file it was read from (if any) and,
+            when `cache_load` is enabled, the file signature taken before the file was parsed.
+
         """
         try:
             cli_values = get_cli_values(cls)
@@ -73,12 +138,20 @@ class BaseConfig(msgspec.Struct):
             env_values = {}
 
         config_path: str | None = cli_values.get("config", None) or env_values.get("config", None)  # pyright: ignore[reportUnknownMemberType, reportAssignmentType]
-        try:
-            yaml_values = get_yaml_values(config_path)
-        except (FileNotFoundError, YAMLError) as err:
-            logger.warning("unable to load config from %s values: %s", config_path, err)
-            yaml_values = {}
-
-        merged_data = update_recursive(yaml_values, update_recursive(env_values, cli_values))  # pyright: ignore[reportUnknownArgumentType]
-
-        return msgspec.convert(merged_data, type=cls, strict=False)
+        # Stat before parsing, so a file changed mid-load is seen as changed on the next load.
+        signature = _file_signature(config_path) if cls.cache_load else None
+        yaml_values: ConfigMapping = {}
+        if config_path:
+            try:
+                if not cls._has_overrides(env_values, cli_values):
+                    # Nothing to merge on top of the file: decode it straight into the struct.
+                    return get_yaml_values_typed(config_path, cls), config_path, signature
+                yaml_values = get_yaml_values(config_path)
+            except FileNotFoundError as err:
+                logger.warning("unable to load config from %s values: %s", config_path, err)
+
+        # All three mappings are owned by this call, so merge into the YAML values in place.
+        merged_data = update_recursive(yaml_values, env_values, inplace=True)
+        merged_data = update_recursive(merged_data, cli_values, inplace=True)
+
+        return msgspec.convert(merged_data, type=cls, strict=False), config_path, signature
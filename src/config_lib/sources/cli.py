@@ -1,31 +1,46 @@
 """Module for retrieving and processing cli args as configuration settings.
 
-This module provides functionality to extract cli args with argparse for each field in the given msgspec.Struct,
-and nest them into a hierarchical dictionary structure.
+This module provides functionality to extract cli args for each field in the given msgspec.Struct,
+and nest them into a hierarchical dictionary structure. Arguments are read with a linear scan over
+the known options; argparse is only used to render `--help`.
 """
 
 from __future__ import annotations
 
-import argparse
-from typing import TYPE_CHECKING
+import functools
+import re
+import sys
+from typing import TYPE_CHECKING, Any
 
 import msgspec
 from msgspec.inspect import StructType
 
-from config_lib.utils.nest import nest_dict
-
 if TYPE_CHECKING:
+    import argparse
+
     from config_lib.utils.types import ConfigMapping
 
+_HELP_OPTIONS = frozenset({"-h", "--help"})
+# Same pattern argparse uses to tell negative numbers from option flags
+_NEGATIVE_NUMBER = re.compile(r"^-\d+$|^-\d*\.\d+$")
+
+
+# Builtin parser types for msgspec inspect types, anything else is parsed as a string
+_BUILTIN_TYPES: dict[type[msgspec.inspect.Type], type] = {
+    msgspec.inspect.BoolType: bool,
+    msgspec.inspect.IntType: int,
+    msgspec.inspect.FloatType: float,
+}
 
-def builtin_type(field_type: type) -> type:
-    if isinstance(field_type, msgspec.inspect.BoolType):
-        return bool
-    if isinstance(field_type, msgspec.inspect.IntType):
-        return int
-    if isinstance(field_type, msgspec.inspect.FloatType):
-        return float
-    return str
+
+def builtin_type(field_type: msgspec.inspect.Type) -> type:
+    return _BUILTIN_TYPES.get(type(field_type), str)
+
+
+@functools.cache
+def _fields(struct_cls: type[msgspec.Struct]) -> tuple[msgspec.inspect.Field, ...]:
+    """Return the inspected fields of a msgspec.Struct, computed once per class."""
+    return msgspec.inspect.type_info(struct_cls).fields
 
 
 def _add_arguments(
@@ -43,7 +58,7 @@ def _add_arguments(
 
     """
     # Iterate through the fields of the struct
-    for field in msgspec.inspect.type_info(struct_cls).fields:
+    for field in _fields(struct_cls):
         # Create the full argument name (with nested prefixes)
         full_name = f"{prefix}{field.name}" if prefix else field.name
         if isinstance(field.type, StructType):
@@ -60,41 +75,81 @@ def _add_arguments(
             )
 
 
-def get_cli_values(cls: type[msgspec.Struct]) -> ConfigMapping:
-    """Parse command-line arguments for a given msgspec.Struct configuration class.
+@functools.cache
+def _compile_schema(
+    struct_cls: type[msgspec.Struct], prefix: str = "", path: tuple[str, ...] = ()
+) -> dict[str, tuple[type, tuple[str, ...]]]:
+    """Compile the CLI schema of a msgspec.Struct once per class.
 
-    This function creates an argparse parser based on the fields of the provided
-    msgspec.Struct class, allowing nested configuration through dot-separated
-    argument names.
+    Nested structures produce dot-separated names, matching the options added by _add_arguments.
 
     Args:
-        cls: A msgspec.Struct subclass defining the configuration structure.
+        struct_cls: The msgspec.Struct class to extract the fields from.
+        prefix: The prefix to use for nested option names (default: "").
+        path: The field path of struct_cls within the top-level struct (default: ()).
 
     Returns:
-        A ConfigMapping containing the parsed configuration values.
+        A dictionary mapping option names (without the leading "--") to their value type
+        and their field path in the nested configuration.
 
-    Raises:
-        SystemExit: If there are errors during argument parsing or validation.
+    """
+    schema: dict[str, tuple[type, tuple[str, ...]]] = {}
+    for field in _fields(struct_cls):
+        full_name = f"{prefix}{field.name}" if prefix else field.name
+        field_path = (*path, field.name)
+        if isinstance(field.type, StructType):
+            schema.update(_compile_schema(field.type.cls, prefix=f"{full_name}.", path=field_path))
+        else:
+            schema[full_name] = (builtin_type(field.type), field_path)
+    return schema
 
-    Notes:
-        - Nested structures are supported through dot-separated argument names
-        - Only specified arguments are processed
-        - Arguments not explicitly defined are ignored
 
+def _nest_values(cls: type[msgspec.Struct], flat_args: dict[str, Any]) -> ConfigMapping:
+    """Nest flat option values along the field paths of the compiled schema."""
+    schema = _compile_schema(cls)
+    result: ConfigMapping = {}
+    for name, value in flat_args.items():
+        *parents, leaf = schema[name][1]
+        node = result
+        for part in parents:
+            node = node.setdefault(part, {})  # pyright: ignore[reportAssignmentType]
+        node[leaf] = value
+    return result
+
+
+def _is_option(token: str, schema: dict[str, tuple[type, tuple[str, ...]]]) -> bool:
+    """Check whether argparse would read a token as an option flag rather than a value.
+
+    A lone "-" is a value. A known option with an inline value (e.g. "--num=1 2") is a flag
+    even if it contains a space; otherwise tokens with spaces and negative numbers are values.
     """
-    # Create an argument parser
-    parser = argparse.ArgumentParser(
-        description=f"Configuration parser for {cls.__name__}"
-    )
+    if not token.startswith("-") or token == "-":
+        return False
+    name, sep, _ = token[2:].partition("=")
+    if sep and token.startswith("--") and name in schema:
+        return True
+    return " " not in token and not _NEGATIVE_NUMBER.match(token)
 
-    # Recursively add arguments for the class and its nested structures
 
-    # Add arguments for the top-level class
+@functools.cache
+def _parser_for(cls: type[msgspec.Struct]) -> argparse.ArgumentParser:
+    """Build the argparse parser for a msgspec.Struct once per class.
+
+    The parser has no defaults or other state that parsing mutates, so it is safe to reuse.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description=f"Configuration parser for {cls.__name__}")
     _add_arguments(parser, cls)
+    return parser
+
 
-    # Parse arguments
+def _parse_with_argparse(cls: type[msgspec.Struct], args: list[str]) -> dict[str, Any]:
+    """Parse arguments with a full argparse parser, used when help output is requested."""
+    # Regular loads go through _scan_args, so the quadratic option scan in
+    # ArgumentParser._parse_known_args before Python 3.13 only affects the help path.
     try:
-        args, _ = parser.parse_known_args()
+        namespace, _ = _parser_for(cls).parse_known_args(args)
     except SystemExit as err:
         err_details = (
             f"param '{err.__context__.args[0].dest}': {err.__context__.args[1]}"
@@ -103,8 +158,86 @@ def get_cli_values(cls: type[msgspec.Struct]) -> ConfigMapping:
         )
         raise ValueError(err_details) from err
 
-    # Convert parsed arguments to a flat dictionary
-    flat_args = {k: v for k, v in vars(args).items() if v is not None}
+    return {k: v for k, v in vars(namespace).items() if v is not None}
+
+
+def _scan_args(cls: type[msgspec.Struct], args: list[str]) -> dict[str, Any]:
+    """Collect known `--name value` / `--name=value` options from args in a single pass.
+
+    Unknown options and positional arguments are ignored, and everything after `--` is
+    treated as positional. When an option is repeated, the last value wins.
+
+    Args:
+        cls: A msgspec.Struct subclass defining the configuration structure.
+        args: The command-line arguments, without the program name.
+
+    Returns:
+        A flat dictionary mapping option names to converted values.
+
+    Raises:
+        ValueError: If an option is missing its value or the value cannot be converted.
+
+    """
+    schema = _compile_schema(cls)
+    flat_args: dict[str, Any] = {}
+
+    index, count = 0, len(args)
+    while index < count:
+        token = args[index]
+        index += 1
+        if token == "--":
+            break
+        if not token.startswith("--"):
+            continue
+
+        name, sep, value = token[2:].partition("=")
+        if name not in schema:
+            continue
+        if not sep:
+            if index >= count or _is_option(args[index], schema):
+                msg = f"param '{name}': expected one argument"
+                raise ValueError(msg)
+            value = args[index]
+            index += 1
+
+        parser_type = schema[name][0]
+        try:
+            flat_args[name] = parser_type(value)
+        except (TypeError, ValueError):
+            msg = f"param '{name}': invalid {parser_type.__name__} value: {value!r}"
+            raise ValueError(msg) from None
+
+    return flat_args
+
+
+def get_cli_values(cls: type[msgspec.Struct]) -> ConfigMapping:
+    """Parse command-line arguments for a given msgspec.Struct configuration class.
+
+    Options are derived from the fields of the provided msgspec.Struct class, allowing
+    nested configuration through dot-separated argument names. Values are converted the
+    same way argparse would; if `-h`/`--help` is given, argparse prints the usage instead.
+
+    Args:
+        cls: A msgspec.Struct subclass defining the configuration structure.
+
+    Returns:
+        A ConfigMapping containing the parsed configuration values.
+
+    Raises:
+        ValueError: If there are errors during argument parsing or validation.
+
+    Notes:
+        - Nested structures are supported through dot-separated argument names
+        - Only specified arguments are processed
+        - Arguments not explicitly defined are ignored
+
+    """
+    args = sys.argv[1:]
+    options_part = args[: args.index("--")] if "--" in args else args
+
+    if _HELP_OPTIONS.isdisjoint(options_part):
+        flat_args = _scan_args(cls, args)
+    else:
+        flat_args = _parse_with_argparse(cls, args)
 
-    # Convert flat dictionary to nested dictionary
-    return nest_dict(flat_args, delimiter=".")
+    return _nest_values(cls, flat_args)
@@ -9,9 +9,11 @@ from __future__ import annotations
 import os
 from typing import TYPE_CHECKING
 
-from config_lib.utils.nest import nest_dict
+from config_lib.utils.nest import nest_items
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from config_lib.utils.types import ConfigMapping
 
 
@@ -20,8 +22,16 @@ def _prepare(key: str, prefix: str) -> str:
     return key[prefix_len:].lower()
 
 
+def _iter_prefixed_values(prefix: str) -> Iterator[tuple[str, str]]:
+    # Same transformation as _prepare, inlined to avoid a call per matching variable.
+    # Iterating keys only means values are fetched (and decoded) just for the matches.
+    prefix_len = len(prefix)
+    environ = os.environ
+    return ((key[prefix_len:].lower(), environ[key]) for key in environ if key.startswith(prefix))
+
+
 def _get_prefixed_values(prefix: str) -> dict[str, str]:
-    return {_prepare(key, prefix): value for key, value in os.environ.items() if key.startswith(prefix)}
+    return dict(_iter_prefixed_values(prefix))
 
 
 def get_env_values(env_prefix: str) -> ConfigMapping:
@@ -38,5 +48,4 @@ def get_env_values(env_prefix: str) -> ConfigMapping:
         A ConfigMapping representing the nested dictionary structure of the environment variables.
 
     """
-    flat_env_dict = _get_prefixed_values(env_prefix)
-    return nest_dict(flat_env_dict)
+    return nest_items(_iter_prefixed_values(env_prefix))
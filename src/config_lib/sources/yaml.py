@@ -1,17 +1,68 @@
-"""Provides functionality to read and parse YAML files into a ConfigMapping."""
+"""Provides functionality to read and parse YAML files into a ConfigMapping or a msgspec.Struct."""
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
+from typing import TypeVar
 
-import yaml
+import msgspec
 
 from config_lib.utils.types import ConfigMapping, is_mapping
 
+StructT = TypeVar("StructT", bound=msgspec.Struct)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_cached(resolved_path: str, mtime_ns: int, size: int) -> ConfigMapping:
+    """Parse a YAML file, memoized on its resolved path, modification time and size.
+
+    Only resolved_path is read; mtime_ns and size are part of the cache key so that a
+    modified file misses the cache. Errors are not cached.
+
+    Args:
+        resolved_path: The absolute path to the YAML file.
+        mtime_ns: The modification time of the file in nanoseconds.
+        size: The size of the file in bytes.
+
+    Returns:
+        The parsed mapping. It is shared between calls and must not be mutated.
+
+    Raises:
+        ValueError: If the file cannot be read or parsed as a YAML mapping.
+
+    """
+    # PyYAML is imported lazily so that env/CLI-only loads never pay for it.
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # pragma: no cover
+        from yaml import SafeLoader
+
+    try:
+        # Hand the raw bytes to the loader so libyaml does the decoding natively.
+        with Path(resolved_path).open("rb") as file:
+            yaml_data = yaml.load(file, Loader=SafeLoader)
+            if not is_mapping(yaml_data):
+                msg = f"The parsed data is not a ConfigMapping, but {type(yaml_data).__name__}."
+                raise ValueError(msg)
+            return yaml_data
+    except OSError as e: # pragma: no cover
+        msg = f"An error occurred while reading the file {resolved_path}: {e}"
+        raise ValueError(msg) from None
+    except yaml.YAMLError as e:
+        msg = f"An error occurred while parsing the YAML file {resolved_path}: {e}"
+        raise ValueError(msg) from None
+
 
 def get_yaml_values(file_path: str | None) -> ConfigMapping:
     """Read and parse a YAML file into a ConfigMapping.
 
+    Parsed files are cached in-process by path, modification time and size,
+    so repeated loads of an unchanged file skip parsing altogether.
+
     Args:
         file_path: The path to the YAML file. If None, an empty ConfigMapping is returned.
 
@@ -20,8 +71,7 @@ def get_yaml_values(file_path: str | None) -> ConfigMapping:
 
     Raises:
         FileNotFoundError: If the specified file does not exist.
-        IOError: If the file cannot be read.
-        yaml.YAMLError: If the file cannot be parsed as YAML.
+        ValueError: If the file cannot be read or parsed as a YAML mapping.
 
     """
     if file_path is None:
@@ -32,16 +82,30 @@ def get_yaml_values(file_path: str | None) -> ConfigMapping:
         msg = f"The file {file_path} does not exist."
         raise FileNotFoundError(msg)
 
-    try:
-        with path.open("r", encoding="utf-8") as file:
-            yaml_data = yaml.safe_load(file)
-            if not is_mapping(yaml_data):
-                msg = f"The parsed data is not a ConfigMapping, but {type(yaml_data).__name__}."
-                raise ValueError(msg)
-            return yaml_data
-    except OSError as e: # pragma: no cover
-        msg = f"An error occurred while reading the file {file_path}: {e}"
-        raise ValueError(msg) from None
-    except yaml.YAMLError as e:
-        msg = f"An error occurred while parsing the YAML file {file_path}: {e}"
-        raise ValueError(msg) from None
+    stat = path.stat()
+    yaml_data = _load_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    # Callers are free to mutate the result, so never hand out the cached mapping itself.
+    return copy.deepcopy(yaml_data)
+
+
+def get_yaml_values_typed(file_path: str, cls: type[StructT]) -> StructT:
+    """Read a YAML file and decode it straight into a msgspec.Struct.
+
+    Used when no other source overrides the YAML values, so the intermediate mapping
+    is converted directly instead of going through a merge first. Parsing goes through
+    get_yaml_values, so the parse cache and error handling are shared.
+
+    Args:
+        file_path: The path to the YAML file.
+        cls: The msgspec.Struct subclass to decode into.
+
+    Returns:
+        An instance of cls with values loaded from the YAML file.
+
+    Raises:
+        FileNotFoundError: If the specified file does not exist.
+        ValueError: If the file cannot be parsed as a YAML mapping.
+        msgspec.ValidationError: If the values do not match the fields of cls.
+
+    """
+    return msgspec.convert(get_yaml_values(file_path), type=cls, strict=False)
@@ -16,6 +16,7 @@ Merging follows the rules:
 
 from __future__ import annotations
 
+from datetime import date, datetime
 from typing import TYPE_CHECKING, Any
 
 from .types import is_mapping, is_scalar, is_sequence
@@ -23,11 +24,20 @@ from .types import is_mapping, is_scalar, is_sequence
 if TYPE_CHECKING: # pragma: no cover
     from .types import ConfigMapping, ConfigScalar, ConfigSequence
 
+# Exact types produced by the sources, checked with a set lookup before falling back
+# to the isinstance-based predicates (which also accept subclasses).
+_SCALAR_TYPES = frozenset({str, int, float, bool, datetime, date})
+_SEQUENCE_TYPES = frozenset({list, tuple})
+
+# Marks a key missing from a mapping, since None is a legitimate value.
+_MISSING: Any = object()
+
 
 def _merge_sequences(target_seq: ConfigSequence, source_seq: ConfigSequence) -> list[ConfigScalar]:
     """Merge two sequences according to union semantics while preserving order.
 
     Elements from source_seq that are already in target_seq will not be added again.
+    Target elements keep their order and unseen source elements are appended after them.
 
     Args:
         target_seq: The original sequence.
@@ -37,10 +47,19 @@ def _merge_sequences(target_seq: ConfigSequence, source_seq: ConfigSequence) ->
         A new list representing the merged sequence.
 
     """
-    return list(set(target_seq) | set(source_seq))
-
-
-def _merge_values(left: Any, right: Any) -> Any:
+    try:
+        # dict keeps insertion order, so this is an ordered single-pass union.
+        seen = dict.fromkeys(target_seq)
+        seen.update(dict.fromkeys(source_seq))
+        return list(seen)
+    except TypeError:
+        # Unhashable elements (e.g. nested lists): fall back to equality checks.
+        merged = list(target_seq)
+        merged.extend(item for item in source_seq if item not in merged)
+        return merged
+
+
+def _merge_values(left: Any, right: Any, *, inplace: bool = False) -> Any:
     """Merge two configuration values according to their types.
 
     If one of the values is None, the other is returned.
@@ -48,6 +67,7 @@ def _merge_values(left: Any, right: Any) -> Any:
     Args:
         left: The value from the target dictionary.
         right: The value from the source dictionary.
+        inplace: Whether mappings are merged into left instead of into a new dictionary.
 
     Returns:
         The merged value.
@@ -62,6 +82,15 @@ def _merge_values(left: Any, right: Any) -> Any:
     if left is None:
         return right
 
+    # Fast paths on exact types, most frequent first.
+    left_type, right_type = type(left), type(right)
+    if left_type is dict and right_type is dict:
+        return update_recursive(left, right, inplace=inplace)
+    if left_type in _SCALAR_TYPES and right_type in _SCALAR_TYPES:
+        return right
+    if left_type in _SEQUENCE_TYPES and right_type in _SEQUENCE_TYPES:
+        return _merge_sequences(left, right)
+
     # If both are scalar values, source takes precedence.
     if is_scalar(left) and is_scalar(right):
         return right
@@ -72,14 +101,14 @@ def _merge_values(left: Any, right: Any) -> Any:
 
     # If both are mappings, merge them recursively.
     if is_mapping(left) and is_mapping(right):
-        return update_recursive(left, right)
+        return update_recursive(left, right, inplace=inplace)
 
     # If types differ, raise ValueError.
     msg = f"Incompatible types for merging: {type(left).__name__} and {type(right).__name__}"
     raise ValueError(msg)
 
 
-def update_recursive(target: ConfigMapping, source: ConfigMapping) -> ConfigMapping:
+def update_recursive(target: ConfigMapping, source: ConfigMapping, *, inplace: bool = False) -> ConfigMapping:
     """Recursively merge two configuration dictionaries according to predefined rules.
 
     For each key:
@@ -89,36 +118,78 @@ def update_recursive(target: ConfigMapping, source: ConfigMapping) -> ConfigMapp
     Args:
         target: The target configuration dictionary.
         source: The source configuration dictionary.
+        inplace: Whether to merge into target without copying (see update_recursive_inplace).
+            Only use it when the caller owns both dictionaries.
 
     Returns:
-        A new configuration dictionary resulting from merging target and source.
+        A new configuration dictionary resulting from merging target and source,
+        or target itself when inplace is True.
 
     Raises:
         ValueError: If a value in target and source have incompatible types according to the rules.
         TypeError: If the provided arguments are not dictionaries.
 
     """
+    if inplace:
+        return update_recursive_inplace(target, source)
+
     if not (is_mapping(target) and is_mapping(source)):
         msg = "Both target and source must be dictionaries (mappings)."
         raise TypeError(msg)
 
     merged: ConfigMapping = {}
 
-    # Get the union of keys from both dictionaries.
-    all_keys = set(target.keys()) | set(source.keys())
-    for key in all_keys:
-        # Retrieve values, defaulting to None if the key does not exist.
-        left_value = target.get(key, None)
-        right_value = source.get(key, None)
-
-        # If the key is in both dictionaries, merge the values.
-        if key in target and key in source:
-            merged[key] = _merge_values(left_value, right_value)
-        elif key in target:
+    # Walk the target once, merging values for keys that are also in the source.
+    for key, left_value in target.items():
+        right_value = source.get(key, _MISSING)
+        if right_value is _MISSING:
             # Rule 5: When source does not have a corresponding non-None value, use target.
             merged[key] = left_value
         else:
-            # Rule 6: When target is missing or None, use the source value.
+            merged[key] = _merge_values(left_value, right_value)
+
+    # Rule 6: Keys missing from the target take the source value.
+    for key, right_value in source.items():
+        if key not in target:
             merged[key] = right_value
 
     return merged
+
+
+def update_recursive_inplace(target: ConfigMapping, source: ConfigMapping) -> ConfigMapping:
+    """Recursively merge source into target, modifying target in place.
+
+    Follows the same rules as update_recursive, but nested mappings present in both
+    dictionaries are merged into the existing target mapping instead of being copied.
+    Values taken from source are inserted by reference, so source should not be reused.
+
+    Args:
+        target: The configuration dictionary to update.
+        source: The configuration dictionary to merge into target.
+
+    Returns:
+        The updated target dictionary.
+
+    Raises:
+        ValueError: If a value in target and source have incompatible types according to the rules.
+        TypeError: If the provided arguments are not dictionaries.
+
+    """
+    if not (is_mapping(target) and is_mapping(source)):
+        msg = "Both target and source must be dictionaries (mappings)."
+        raise TypeError(msg)
+
+    # Walk nested mappings with an explicit stack instead of recursing.
+    stack = [(target, source)]
+    while stack:
+        current_target, current_source = stack.pop()
+        for key, right_value in current_source.items():
+            left_value = current_target.get(key, _MISSING)
+            if left_value is _MISSING:
+                current_target[key] = right_value
+            elif is_mapping(left_value) and is_mapping(right_value):
+                stack.append((left_value, right_value))
+            else:
+                current_target[key] = _merge_values(left_value, right_value, inplace=True)
+
+    return target
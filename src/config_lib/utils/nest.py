@@ -6,40 +6,60 @@ nested structure and to build nested dictionaries accordingly.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 NEST_DELIMITER: str = "__"
 
 
 def _split_key(key: str, delimiter: str = NEST_DELIMITER) -> list[str]:
-    """Split the key using the given delimiter.
+    """Split the key into its nesting path in a single forward scan.
+
+    Consecutive delimiters in the middle of the key are folded into the preceding part
+    (e.g. "a____b" gives ["a__", "b"]), trailing delimiters are dropped, and a key that
+    starts with the delimiter is kept whole.
 
     Args:
         key: The key to split.
         delimiter: The delimiter used to separate key parts.
 
     Returns:
-        A list of key parts, empty parts are preserved except for trailing ones.
+        A list of key parts.
 
     Raises:
         ValueError: If the key is exactly the delimiter.
 
     """
-    if not key.replace(delimiter, ""):
-        msg = f"Key cannot be only the delimiter: '{delimiter}'"
-        raise ValueError(msg)
-
     # Special case: if key starts with delimiter, keep it as is
     if key.startswith(delimiter):
+        if not key.replace(delimiter, ""):
+            msg = f"Key cannot be only the delimiter: '{delimiter}'"
+            raise ValueError(msg)
         return [key]
 
-    # Split the key but preserve empty parts in the middle
-    parts = key.split(delimiter)
-
-    # Remove trailing empty parts only
-    while parts and not parts[-1]:
-        _ = parts.pop()
-
+    delimiter_len = len(delimiter)
+    parts: list[str] = []
+    end = key.find(delimiter)
+    current = key if end < 0 else key[:end]
+    # Number of empty parts seen since the last non-empty one
+    empty_parts = 0
+
+    while end >= 0:
+        start = end + delimiter_len
+        end = key.find(delimiter, start)
+        part = key[start:] if end < 0 else key[start:end]
+        if not part:
+            empty_parts += 1
+            continue
+        # Empty parts in the middle stick to the preceding part as delimiters
+        parts.append(current + delimiter * empty_parts)
+        current = part
+        empty_parts = 0
+
+    # Remaining empty parts are trailing ones and are dropped
+    parts.append(current)
     return parts
 
 
@@ -54,7 +74,7 @@ def _insert_nested(
 
     Args:
         current: The current level of the nested dictionary.
-        parts: List of key parts representing the nesting path.
+        parts: List of key parts representing the nesting path, as returned by _split_key.
         value: The value to insert.
         full_key: The full original key, used for generating informative error messages.
         delimiter: The delimiter used to join parts for error reporting.
@@ -63,52 +83,32 @@ def _insert_nested(
         ValueError: If a conflict occurs between nested and non-nested keys.
 
     """
-    # Handle empty parts by joining them with the previous non-empty part
-    processed_parts: list[str] = []
-    current_part = parts[0]
-
-    for part in parts[1:-1]:
-        if part:
-            # If we have accumulated parts, add them and start new
-            if current_part:
-                processed_parts.append(current_part)
-            current_part = part
-        else:
-            # Add delimiter to the current part
-            current_part += delimiter
-
-    # Add the last accumulated part
-    if current_part:
-        processed_parts.append(current_part)
-
-    # Add the final part
-    processed_parts.append(parts[-1])
-
-    # Now process the consolidated parts
-    for i, part in enumerate(processed_parts[:-1]):
-        if part in current:
-            if not isinstance(current[part], dict):
-                conflict_key = delimiter.join(processed_parts[: i + 1])
-                msg = f"Conflicting keys: '{conflict_key}' conflicts with a non-nested key."
-                raise ValueError(msg)
-        else:
-            current[part] = {}
-        current = current[part]
+    for i, part in enumerate(parts[:-1]):
+        # One lookup per level: descend into the existing dict or create it
+        node = current.setdefault(part, {})
+        if isinstance(node, dict):
+            current = node
+            continue
+        conflict_key = delimiter.join(parts[: i + 1])
+        msg = f"Conflicting keys: '{conflict_key}' conflicts with a non-nested key."
+        raise ValueError(msg)
 
-    last_part = processed_parts[-1]
+    last_part = parts[-1]
     if last_part in current and isinstance(current[last_part], dict):
         msg = f"Conflicting keys: '{full_key}' conflicts with existing nested dictionary."
         raise ValueError(msg)
     current[last_part] = value
 
 
-def nest_dict(flat_dict: dict[str, str], delimiter: str = NEST_DELIMITER) -> dict[str, Any]:
-    """Convert a flat dictionary with delimited keys to a nested dictionary.
+def nest_items(items: Iterable[tuple[str, Any]], delimiter: str = NEST_DELIMITER) -> dict[str, Any]:
+    """Build a nested dictionary from (key, value) pairs with delimited keys.
 
-    For example, {"a__b__c": 1, "a__d": 2} becomes {"a": {"b": {"c": 1}, "d": 2}}.
+    Works like nest_dict, but consumes any iterable of pairs so callers can stream
+    items in without building an intermediate flat dictionary. If a key repeats,
+    the last value wins.
 
     Args:
-        flat_dict: The flat dictionary to convert.
+        items: The (key, value) pairs to convert.
         delimiter: The delimiter used to separate nested keys.
 
     Returns:
@@ -121,9 +121,9 @@ def nest_dict(flat_dict: dict[str, str], delimiter: str = NEST_DELIMITER) -> dic
     """
     result: dict[str, Any] = {}
 
-    # Process each key-value pair in the flat dictionary.
+    # Process each key-value pair.
 
-    for key, value in flat_dict.items():
+    for key, value in items:
         if not key:
             continue  # Skip empty keys
 
@@ -131,17 +131,15 @@ def nest_dict(flat_dict: dict[str, str], delimiter: str = NEST_DELIMITER) -> dic
 
         # Handle non-nested keys where no splitting was necessary.
         if len(parts) == 1:
-            # If the key is the original key (like "__s"), keep it as is
-            if key.startswith(delimiter) or delimiter not in key:
+            # The key was kept whole (like "s" or "__s") unless trailing delimiters were
+            # stripped (like "a__"), so comparing lengths avoids rescanning the key.
+            if len(parts[0]) == len(key):
                 # Check for conflicts with nested keys
                 base_key = parts[0]
-                if base_key in result:
-                    # Check if the existing value is a dictionary
-                    if isinstance(result[base_key], dict):
-                        msg = f"Conflicting keys: '{key}' attempts to overwrite nested dictionary with scalar value."
-                        raise ValueError(msg)
-                else:
-                    result[base_key] = value
+                if isinstance(result.get(base_key), dict):
+                    msg = f"Conflicting keys: '{key}' attempts to overwrite nested dictionary with scalar value."
+                    raise ValueError(msg)
+                result[base_key] = value
             else:
                 # Normal flat key processing
                 result[key] = value
@@ -149,3 +147,26 @@ def nest_dict(flat_dict: dict[str, str], delimiter: str = NEST_DELIMITER) -> dic
             _insert_nested(result, parts, value, key, delimiter)
 
     return result
+
+
+def nest_dict(flat_dict: dict[str, str], delimiter: str = NEST_DELIMITER) -> dict[str, Any]:
+    """Convert a flat dictionary with delimited keys to a nested dictionary.
+
+    For example, {"a__b__c": 1, "a__d": 2} becomes {"a": {"b": {"c": 1}, "d": 2}}.
+
+    Args:
+        flat_dict: The flat dictionary to convert.
+        delimiter: The delimiter used to separate nested keys.
+
+    Returns:
+        A nested dictionary mapping.
+
+    Raises:
+        ValueError: If a key contains only the delimiter or if there are conflicts
+                    between nested and non-nested keys.
+
+    """
+    # Fast path: without any delimiter there is nothing to nest and no conflict to detect.
+    if not any(delimiter in key for key in flat_dict):
+        return {key: value for key, value in flat_dict.items() if key}
+    return nest_items(flat_dict.items(), delimiter)
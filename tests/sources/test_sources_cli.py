@@ -79,3 +79,70 @@ def test__add_arguments() -> None:
     assert actions[0].dest == "help"
     assert actions[1].dest == "name"
     assert actions[2].dest == "nested.nested_value"
+
+
+def test_config_from_cli_equals_syntax_and_unknown_arguments() -> None:
+    class Config(msgspec.Struct):
+        name: str
+        value: int
+
+    import sys
+
+    sys.argv = ["test_program", "--other", "x", "--name=test_name", "--value", "-5", "--", "--name", "ignored"]
+
+    assert get_cli_values(Config) == {"name": "test_name", "value": -5}
+
+
+def test_config_from_cli_missing_value() -> None:
+    class Config(msgspec.Struct):
+        name: str
+
+    import sys
+
+    sys.argv = ["test_program", "--name"]
+
+    with pytest.raises(ValueError, match="param 'name': expected one argument"):
+        _ = get_cli_values(Config)
+
+
+def test_config_from_cli_dash_value() -> None:
+    class Config(msgspec.Struct):
+        name: str
+        num: int
+
+    import sys
+
+    sys.argv = ["test_program", "--name", "-", "--num", "4"]
+    assert get_cli_values(Config) == {"name": "-", "num": 4}
+
+    sys.argv = ["test_program", "--num", "-"]
+    with pytest.raises(ValueError, match="param 'num': invalid int value: '-'"):
+        _ = get_cli_values(Config)
+
+
+def test_config_from_cli_known_option_with_inline_value_is_not_a_value() -> None:
+    class Config(msgspec.Struct):
+        name: str
+        num: int
+
+    import sys
+
+    sys.argv = ["test_program", "--name", "--num=1 2"]
+    with pytest.raises(ValueError, match="param 'name': expected one argument"):
+        _ = get_cli_values(Config)
+
+    sys.argv = ["test_program", "--name", "--other=1 2"]
+    assert get_cli_values(Config) == {"name": "--other=1 2"}
+
+
+@pytest.mark.parametrize("help_option", ["-h", "--help"])
+def test_config_from_cli_help_uses_argparse(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], help_option: str
+) -> None:
+    class Config(msgspec.Struct):
+        name: str
+
+    monkeypatch.setattr("sys.argv", ["test_program", "--name", "test_name", help_option])
+    with pytest.raises(ValueError, match="unknown error"):
+        _ = get_cli_values(Config)
+    assert "--name NAME" in capsys.readouterr().out
@@ -1,8 +1,9 @@
 from pathlib import Path
 
+import msgspec
 import pytest
 
-from config_lib.sources.yaml import get_yaml_values
+from config_lib.sources.yaml import get_yaml_values, get_yaml_values_typed
 
 
 @pytest.fixture
@@ -55,3 +56,28 @@ def test_non_mapping_yaml_file(non_mapping_yaml_file: Path) -> None:
 def test_none_file_path() -> None:
     result = get_yaml_values(None)
     assert result == {}
+
+
+def test_cached_result_is_a_copy(valid_yaml_file: Path) -> None:
+    first = get_yaml_values(str(valid_yaml_file))
+    first["key1"] = "changed"
+    assert get_yaml_values(str(valid_yaml_file))["key1"] == "value1"
+
+
+def test_cache_invalidated_on_change(valid_yaml_file: Path) -> None:
+    assert get_yaml_values(str(valid_yaml_file))["key1"] == "value1"
+    _ = valid_yaml_file.write_text("key1: other_value\n")
+    assert get_yaml_values(str(valid_yaml_file)) == {"key1": "other_value"}
+
+
+def test_typed_yaml_file(valid_yaml_file: Path) -> None:
+    class SubConfig(msgspec.Struct):
+        subkey1: str
+        subkey2: str
+
+    class Config(msgspec.Struct):
+        key1: str
+        key2: SubConfig
+
+    result = get_yaml_values_typed(str(valid_yaml_file), Config)
+    assert result == Config(key1="value1", key2=SubConfig(subkey1="subvalue1", subkey2="subvalue2"))
@@ -215,3 +215,106 @@ def test_config_multiple_source_conflicts(monkeypatch: pytest.MonkeyPatch, tmp_p
     config = ErrorConfig.load()
     assert config.required_param == "cli_value"
     assert config.optional_param == 300
+
+
+class ConfigFieldConfig(BaseConfig):
+    """Configuration class that declares the config path as a field."""
+
+    config: str = ""
+    param1: str = "default1"
+
+
+def test_base_config_yaml_only_keeps_config_field(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that a declared config field is kept when YAML is the only other source."""
+    config_file = tmp_path / "config.yaml"
+    _ = config_file.write_text("param1: yaml_value1")
+    monkeypatch.setenv("CFG_CONFIG", str(config_file))
+    config = ConfigFieldConfig.load()
+    assert config.config == str(config_file)
+    assert config.param1 == "yaml_value1"
+
+
+def test_base_config_yaml_only_parse_error(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that the YAML-only path reports parse errors like the merge path."""
+    config_file = tmp_path / "invalid_config.yaml"
+    _ = config_file.write_text(": invalid yaml syntax")
+    monkeypatch.setenv("CFG_CONFIG", str(config_file))
+    with pytest.raises(ValueError, match="An error occurred while parsing the YAML file"):
+        _ = SampleConfig.load()
+
+
+class CachedConfig(BaseConfig):
+    """Configuration class with cached loading."""
+
+    cache_load = True
+
+    param1: str = "default1"
+
+
+def test_base_config_cache_load(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that cached loads are reused until a source changes."""
+    config_file = tmp_path / "config.yaml"
+    _ = config_file.write_text("param1: yaml_value1")
+    monkeypatch.setenv("CFG_CONFIG", str(config_file))
+    monkeypatch.setattr("sys.argv", ["script_name"])
+    CachedConfig.clear_load_cache()
+
+    config = CachedConfig.load()
+    assert config.param1 == "yaml_value1"
+    assert CachedConfig.load() is config
+
+    _ = config_file.write_text("param1: yaml_value22")
+    config = CachedConfig.load()
+    assert config.param1 == "yaml_value22"
+
+    monkeypatch.setenv("CFG_PARAM1", "env_value1")
+    assert CachedConfig.load().param1 == "env_value1"
+
+    monkeypatch.setattr("sys.argv", ["script_name", "--param1", "cli_value1"])
+    assert CachedConfig.load().param1 == "cli_value1"
+
+    cached = CachedConfig.load()
+    CachedConfig.clear_load_cache()
+    assert CachedConfig.load() is not cached
+
+
+def test_base_config_cache_load_file_changed_during_load(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Test that a YAML file modified while it is being loaded is reloaded on the next call."""
+    import config_lib.base
+
+    config_file = tmp_path / "config.yaml"
+    _ = config_file.write_text("param1: yaml_value1")
+    monkeypatch.setenv("CFG_CONFIG", str(config_file))
+    monkeypatch.setattr("sys.argv", ["script_name"])
+    CachedConfig.clear_load_cache()
+
+    original = config_lib.base.get_yaml_values_typed
+
+    def load_then_modify(file_path: str, cls: type[CachedConfig]) -> CachedConfig:
+        config = original(file_path, cls)
+        _ = config_file.write_text("param1: yaml_value22")
+        return config
+
+    monkeypatch.setattr(config_lib.base, "get_yaml_values_typed", load_then_modify)
+    assert CachedConfig.load().param1 == "yaml_value1"
+
+    monkeypatch.setattr(config_lib.base, "get_yaml_values_typed", original)
+    assert CachedConfig.load().param1 == "yaml_value22"
+
+
+def test_base_config_cache_load_keeps_latest_only(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that only the latest load result is cached per class."""
+    monkeypatch.delenv("CFG_CONFIG", raising=False)
+    CachedConfig.clear_load_cache()
+
+    monkeypatch.setattr("sys.argv", ["script_name", "--param1", "first"])
+    first = CachedConfig.load()
+    assert CachedConfig.load() is first
+
+    monkeypatch.setattr("sys.argv", ["script_name", "--param1", "second"])
+    assert CachedConfig.load().param1 == "second"
+
+    monkeypatch.setattr("sys.argv", ["script_name", "--param1", "first"])
+    reloaded = CachedConfig.load()
+    assert reloaded == first
+    assert reloaded is not first
@@ -4,7 +4,11 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-from config_lib.utils.merge import _merge_values, update_recursive  # pyright: ignore[reportPrivateUsage]
+from config_lib.utils.merge import (  # pyright: ignore[reportPrivateUsage]
+    _merge_values,
+    update_recursive,
+    update_recursive_inplace,
+)
 
 if TYPE_CHECKING:
     from config_lib.utils.types import ConfigMapping
@@ -29,6 +33,11 @@ def test_merge_values_sequence() -> None:
     assert _merge_values(None, (1, 2)) == (1, 2)
 
 
+def test_merge_values_sequence_order() -> None:
+    assert _merge_values([3, 1, 2], [5, 1, 4]) == [3, 1, 2, 5, 4]
+    assert _merge_values([[1], [2]], [[2], [3]]) == [[1], [2], [3]]
+
+
 def test_merge_values_mapping() -> None:
     assert _merge_values({"a": 1}, {"b": 2}) == {"a": 1, "b": 2}
     assert _merge_values({"a": 1}, {"a": 2}) == {"a": 2}
@@ -88,3 +97,31 @@ def test_update_recursive_non_dict() -> None:
     source = [1, 2]
     with pytest.raises(TypeError):
         _ = update_recursive(target, source)  # pyright: ignore[reportArgumentType]
+
+
+def test_update_recursive_inplace() -> None:
+    nested: ConfigMapping = {"b": 1, "c": 2}
+    target: ConfigMapping = {"a": nested, "e": [1]}
+    source: ConfigMapping = {"a": {"b": 3, "d": 4}, "e": [2], "f": None}
+    result = update_recursive_inplace(target, source)
+    assert result is target
+    assert target["a"] is nested
+    assert target == {"a": {"b": 3, "c": 2, "d": 4}, "e": [1, 2], "f": None}
+
+
+def test_update_recursive_inplace_incompatible_types() -> None:
+    with pytest.raises(ValueError, match="Incompatible types for merging"):
+        _ = update_recursive_inplace({"a": {"b": 1}}, {"a": "scalar"})
+    with pytest.raises(TypeError):
+        _ = update_recursive_inplace({"a": 1}, [1, 2])  # pyright: ignore[reportArgumentType]
+
+
+def test_update_recursive_inplace_flag() -> None:
+    target: ConfigMapping = {"a": {"b": 1}}
+    source: ConfigMapping = {"a": {"c": 2}}
+    assert update_recursive(target, source, inplace=True) is target
+    assert target == {"a": {"b": 1, "c": 2}}
+
+    left = {"a": 1}
+    assert _merge_values(left, {"b": 2}, inplace=True) is left
+    assert _merge_values(left, {"c": 3}) is not left
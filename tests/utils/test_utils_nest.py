@@ -2,7 +2,7 @@
 
 import pytest
 
-from config_lib.utils.nest import nest_dict
+from config_lib.utils.nest import nest_dict, nest_items
 
 
 def test_nest_dict_empty() -> None:
@@ -167,3 +167,9 @@ def test_nest_dict_nested_key_with_multiple_empty_parts() -> None:
     source: dict[str, str] = {"a____b____c": "1"}
     expected = {"a__": {"b__": {"c": "1"}}}
     assert nest_dict(source) == expected
+
+
+def test_nest_items_from_generator() -> None:
+    """Test building a nested dictionary from a stream of pairs."""
+    items = ((key, value) for key, value in [("a__b", "1"), ("c", "2"), ("c", "3")])
+    assert nest_items(items) == {"a": {"b": "1"}, "c": "3"}